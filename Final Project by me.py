@@ -1,22 +1,201 @@
+import csv
 import random
-import pandas as pd
-from datetime import datetime, timedelta
-from collections import deque
+import sys
+import itertools
+from datetime import date, datetime, timedelta
+from collections import Counter, defaultdict, deque
 import warnings as wg
 from prettytable import PrettyTable
-import pyttsx3 as sp
+from wcwidth import wcswidth
+from sortedcontainers import SortedDict, SortedList
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 
 wg.simplefilter(action="ignore")
 
+_VALID_BLOOD_GROUPS = frozenset(("A+", "A-", "B+", "B-", "O+", "O-", "AB+", "AB-"))
+_HISTORY_STREAM_THRESHOLD = 1000  # larger histories are streamed as CSV
+_PATIENT_HISTORY_COLUMNS = [
+    "Patient ID", "Name", "Age", "Gender", "Blood Group", "Doctor", "Type", "Queue Number",
+    "Timestamp", "Status", "Room", "Estimated Wait Time", "Medical History", "Insurance", "Emergency Contact"
+]
+_QUEUE_HISTORY_COLUMNS = ["queue_id", "patient_id", "entry_time", "is_emergency", "priority", "estimated_wait"]
+
+_MENU_EXIT = object()  # returned by a menu handler to leave its menu loop
+
+# Static menus and headers, each emitted with a single write
+_RULE = "=" * 50
+
+_ROOM_MENU = "\n".join([
+    "",
+    "----- Room Management Menu -----",
+    "1. View Available Rooms",
+    "2. View Occupied Rooms",
+    "3. Assign Room",
+    "4. Release Room",
+    "5. Back to Main Menu"
+]) + "\n"
+
+_APPOINTMENT_MENU = "\n".join([
+    "",
+    "----- Appointment Management Menu -----",
+    "1. View All Appointments",
+    "2. Schedule New Appointment",
+    "3. Cancel Appointment",
+    "4. Back to Main Menu"
+]) + "\n"
+
+_BILLING_MENU = "\n".join([
+    "",
+    "----- Billing Menu -----",
+    "1. Generate Bill",
+    "2. View Billing History",
+    "3. Update Payment Status",
+    "4. Back to Main Menu"
+]) + "\n"
+
+_INVENTORY_MENU = "\n".join([
+    "",
+    "----- Inventory Menu -----",
+    "1. View Inventory",
+    "2. Add Item",
+    "3. Update Stock",
+    "4. Back to Main Menu"
+]) + "\n"
+
+_PATIENT_MENU = "\n".join([
+    "",
+    _RULE,
+    "           Patient Management Menu",
+    _RULE,
+    "1. Add New Patient",
+    "2. Add Emergency Patient",
+    "3. View Patient Details",
+    "4. Update Patient Information",
+    "5. Search Patient Record",
+    "6. View All Patients",
+    "7. Process Next Patient",
+    "8. Process Emergency Patient",
+    "9. Back to Main Menu",
+    _RULE
+]) + "\n"
+
+_PATIENT_DETAILS_HEADER = "\n".join([
+    "",
+    _RULE,
+    "           Patient Details",
+    _RULE
+]) + "\n"
+
+_UPDATE_PATIENT_MENU = "\n".join([
+    "",
+    _RULE,
+    "           Update Patient Information",
+    _RULE,
+    "1. Update Contact Information",
+    "2. Add Medical History",
+    "3. Add Prescription",
+    "4. Update Insurance Details",
+    "5. Update Emergency Contact",
+    "6. Back"
+]) + "\n"
+
+_ALL_PATIENTS_HEADER = "\n".join([
+    "",
+    _RULE,
+    "           All Patients",
+    _RULE
+]) + "\n"
+
+_REPORTS_MENU = "\n".join([
+    "",
+    "----- Reports Menu -----",
+    "1. Patient History Report",
+    "2. Department Statistics",
+    "3. Occupancy Report",
+    "4. Appointment Summary",
+    "5. Queue Analysis Report",
+    "6. Financial Summary",
+    "7. Back to Main Menu"
+]) + "\n"
+
+_QUEUE_STATUS_HEADER = "\n".join([
+    "",
+    _RULE,
+    "           Queue Status",
+    _RULE
+]) + "\n"
+
+_MAIN_MENU = "\n".join([
+    "",
+    _RULE,
+    "           H-A-F-M Hospital Management System",
+    _RULE,
+    "1. Patient Management",
+    "2. Queue Management",
+    "3. Room Management",
+    "4. Appointment Management",
+    "5. Reports",
+    "6. Billing",
+    "7. Inventory",
+    "8. Exit",
+    _RULE
+]) + "\n"
+
+def _render_table(headers: List[str], rows: List[list]) -> str:
+    """
+    Renders rows as a bordered text table in the same layout as PrettyTable.
+
+    Parameters:
+        headers (List[str]): The column titles.
+        rows (List[list]): The table rows, one value per column.
+
+    Returns:
+        str: The rendered table.
+    """
+    cells = [[str(value) for value in row] for row in rows]
+    # Measure display width like PrettyTable, so wide and combining characters line up
+    widths = [wcswidth(header) for header in headers]
+    for row in cells:
+        for i, value in enumerate(row):
+            value_width = wcswidth(value)
+            if value_width > widths[i]:
+                widths[i] = value_width
+
+    def format_row(values):
+        padded = []
+        for value, width in zip(values, widths):
+            # PrettyTable centering: odd slack goes right for odd-width text, left otherwise
+            value_width = wcswidth(value)
+            excess = width - value_width
+            left = excess // 2 + (excess % 2 and not value_width % 2)
+            padded.append(" " * left + value + " " * (excess - left))
+        return "| " + " | ".join(padded) + " |"
+
+    border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    lines = [border, format_row(headers), border]
+    lines.extend(format_row(row) for row in cells)
+    lines.append(border)
+    return "\n".join(lines)
+
 class Patient:
+    __slots__ = (
+        "patient_id", "age", "_first_name", "_last_name", "full_name", "gender", "contact",
+        "room", "doctor_name", "appointment_time", "is_emergency", "admission_time",
+        "queue_number", "estimated_wait_time", "medical_history", "prescriptions",
+        "allergies", "blood_group", "insurance_details", "emergency_contact",
+        "last_visit", "payment_status", "discharge_summary"
+    )
+
     def __init__(self, patient_id: int, age: int, first_name: str, last_name: str, gender: str, contact: str):
         self.patient_id = patient_id
         self.age = age
-        self.first_name = first_name
-        self.last_name = last_name
+        self._first_name = first_name
+        self._last_name = last_name
+        self.full_name = f"{first_name} {last_name}"
         self.gender = gender
         self.contact = contact
         self.room = None
@@ -36,15 +215,39 @@ class Patient:
         self.payment_status = "Pending"
         self.discharge_summary = None
 
+    @property
+    def first_name(self) -> str:
+        return self._first_name
+
+    @first_name.setter
+    def first_name(self, value: str):
+        self._first_name = value
+        self.full_name = f"{value} {self._last_name}"
+
+    @property
+    def last_name(self) -> str:
+        return self._last_name
+
+    @last_name.setter
+    def last_name(self, value: str):
+        self._last_name = value
+        self.full_name = f"{self._first_name} {value}"
+
     def add_medical_history(self, condition: str, date: datetime):
-        self.medical_history.append({"condition": condition, "date": date})
+        self.medical_history.append({
+            "condition": condition,
+            "date": date,
+            "date_str": date.strftime("%Y-%m-%d")
+        })
 
     def add_prescription(self, medicine: str, dosage: str, duration: str):
+        date_prescribed = datetime.now()
         self.prescriptions.append({
             "medicine": medicine,
             "dosage": dosage,
             "duration": duration,
-            "date_prescribed": datetime.now()
+            "date_prescribed": date_prescribed,
+            "date_prescribed_str": date_prescribed.strftime("%Y-%m-%d")
         })
 
     def update_insurance(self, provider: str, policy_number: str, coverage: float):
@@ -64,7 +267,7 @@ class Patient:
     def to_dict(self) -> dict:
         return {
             "patient_id": self.patient_id,
-            "name": f"{self.first_name} {self.last_name}",
+            "name": self.full_name,
             "age": self.age,
             "gender": self.gender,
             "contact": self.contact,
@@ -78,85 +281,39 @@ class Patient:
 
 class EmergencyStack:
     def __init__(self):
-        self.items = []
+        self.items = deque()  # top of the stack is items[0]
     
     def is_empty(self):
         return len(self.items) == 0
     
     def push(self, patient: Patient):
-        self.items.append(patient)
+        self.items.appendleft(patient)
     
     def pop(self) -> Optional[Patient]:
         if not self.is_empty():
-            return self.items.pop()
+            return self.items.popleft()
         return None
     
     def peek(self) -> Optional[Patient]:
         if not self.is_empty():
-            return self.items[-1]
+            return self.items[0]
         return None
     
     def size(self):
         return len(self.items)
 
-class PatientNode:
-    def __init__(self, patient: Patient):
-        self.patient = patient
-        self.left = None
-        self.right = None
-
-class PatientBST:
-    def __init__(self):
-        self.root = None
-    
-    def insert(self, patient: Patient):
-        if not self.root:
-            self.root = PatientNode(patient)
-        else:
-            self._insert_recursive(self.root, patient)
-    
-    def _insert_recursive(self, node: PatientNode, patient: Patient):
-        if patient.patient_id < node.patient.patient_id:
-            if node.left is None:
-                node.left = PatientNode(patient)
-            else:
-                self._insert_recursive(node.left, patient)
-        else:
-            if node.right is None:
-                node.right = PatientNode(patient)
-            else:
-                self._insert_recursive(node.right, patient)
-    
-    def search(self, patient_id: int) -> Optional[Patient]:
-        return self._search_recursive(self.root, patient_id)
-    
-    def _search_recursive(self, node: PatientNode, patient_id: int) -> Optional[Patient]:
-        if node is None or node.patient.patient_id == patient_id:
-            return node.patient if node else None
-        
-        if patient_id < node.patient.patient_id:
-            return self._search_recursive(node.left, patient_id)
-        return self._search_recursive(node.right, patient_id)
-    
-    def inorder_traversal(self) -> List[Patient]:
-        patients = []
-        self._inorder_recursive(self.root, patients)
-        return patients
-    
-    def _inorder_recursive(self, node: PatientNode, patients: List[Patient]):
-        if node:
-            self._inorder_recursive(node.left, patients)
-            patients.append(node.patient)
-            self._inorder_recursive(node.right, patients)
-
 class QueueManager:
     def __init__(self):
-        self.regular_queue = deque()
-        self.emergency_queue = deque()
         self.current_queue_number = 1000
         self.average_service_time = 15  # minutes
         self.max_waiting_time = 120  # minutes
-        self.queue_history = []
+        self.queue_history = []  # tuples laid out as _QUEUE_HISTORY_COLUMNS
+        self._history_df = None
+        self._history_df_len = 0
+        # Running aggregates over the estimated wait of every queued patient
+        self._wait_sum = 0.0
+        self._wait_count = 0
+        self._wait_times = SortedList()
         self.service_counters = 3
         self.active_counters = set()
         self.priority_levels = {
@@ -165,6 +322,10 @@ class QueueManager:
             "Medium": 3,
             "Low": 4
         }
+        # One FIFO bucket per priority level, kept in service order
+        levels = sorted(self.priority_levels.values())
+        self.regular_buckets = {level: deque() for level in levels}
+        self.emergency_buckets = {level: deque() for level in levels}
 
     def generate_queue_number(self) -> int:
         self.current_queue_number += 1
@@ -176,108 +337,207 @@ class QueueManager:
             return min(base_time / 2, self.max_waiting_time)
         return min(base_time, self.max_waiting_time)
 
-    def add_to_queue(self, patient: Patient, is_emergency: bool = False, priority: str = "Medium") -> str:
+    def add_to_queue(self, patient: Patient, is_emergency: bool = False, priority: str = "Medium",
+                     entry_time: Optional[datetime] = None) -> str:
+        now = datetime.now() if entry_time is None else entry_time
         patient.queue_number = self.generate_queue_number()
-        queue_position = len(self.emergency_queue if is_emergency else self.regular_queue)
+        queue_position = self.queue_length(is_emergency)
         patient.estimated_wait_time = self.calculate_wait_time(queue_position, is_emergency)
+        self._track_wait(patient.estimated_wait_time)
 
         queue_entry = {
             "patient": patient,
-            "entry_time": datetime.now(),
+            "entry_time": now,
             "priority": priority,
             "priority_level": self.priority_levels.get(priority, 3)
         }
 
         if is_emergency:
-            self.emergency_queue.append(queue_entry)
+            self.emergency_buckets[queue_entry["priority_level"]].append(queue_entry)
             queue_id = f"E{patient.queue_number}"
         else:
-            self.regular_queue.append(queue_entry)
+            self.regular_buckets[queue_entry["priority_level"]].append(queue_entry)
             queue_id = f"R{patient.queue_number}"
 
-        self.queue_history.append({
-            "queue_id": queue_id,
-            "patient_id": patient.patient_id,
-            "entry_time": datetime.now(),
-            "is_emergency": is_emergency,
-            "priority": priority,
-            "estimated_wait": patient.estimated_wait_time
-        })
+        self.queue_history.append(
+            (queue_id, patient.patient_id, now, is_emergency, priority, patient.estimated_wait_time)
+        )
 
         return queue_id
 
-    def get_next_patient(self) -> Optional[Patient]:
-        if not self.emergency_queue and not self.regular_queue:
-            return None
+    def queue_history_df(self):
+        # queue_history is append-only, so its length tells whether the cached frame is stale
+        if self._history_df is None or self._history_df_len != len(self.queue_history):
+            import pandas as pd
+            self._history_df = pd.DataFrame(self.queue_history, columns=_QUEUE_HISTORY_COLUMNS)
+            self._history_df_len = len(self.queue_history)
+        return self._history_df
 
-        if self.emergency_queue:
-            sorted_emergency = sorted(
-                self.emergency_queue,
-                key=lambda x: (x["priority_level"], x["entry_time"])
-            )
-            entry = sorted_emergency[0]
-            self.emergency_queue.remove(entry)
-            return entry["patient"]
-
-        if self.regular_queue:
-            sorted_regular = sorted(
-                self.regular_queue,
-                key=lambda x: (x["priority_level"], x["entry_time"])
-            )
-            entry = sorted_regular[0]
-            self.regular_queue.remove(entry)
-            return entry["patient"]
+    def _track_wait(self, wait_time: float):
+        self._wait_sum += wait_time
+        self._wait_count += 1
+        self._wait_times.add(wait_time)
+
+    def _untrack_wait(self, wait_time: float):
+        self._wait_count -= 1
+        self._wait_sum = self._wait_sum - wait_time if self._wait_count else 0.0
+        self._wait_times.remove(wait_time)
+
+    def queue_length(self, is_emergency: bool) -> int:
+        buckets = self.emergency_buckets if is_emergency else self.regular_buckets
+        return sum(len(bucket) for bucket in buckets.values())
+
+    def queued_entries(self, is_emergency: bool):
+        buckets = self.emergency_buckets if is_emergency else self.regular_buckets
+        return itertools.chain.from_iterable(buckets.values())
+
+    def get_next_patient(self) -> Optional[Patient]:
+        for buckets in (self.emergency_buckets, self.regular_buckets):
+            for bucket in buckets.values():
+                if bucket:
+                    patient = bucket.popleft()["patient"]
+                    self._untrack_wait(patient.estimated_wait_time)
+                    return patient
 
         return None
 
     def update_wait_times(self):
-        for i, entry in enumerate(sorted(self.emergency_queue, key=lambda x: x["priority_level"])):
-            patient = entry["patient"]
-            patient.estimated_wait_time = self.calculate_wait_time(i, True)
+        wait_times = []
+
+        for i, entry in enumerate(self.queued_entries(True)):
+            wait = self.calculate_wait_time(i, True)
+            entry["patient"].estimated_wait_time = wait
+            wait_times.append(wait)
+
+        emergency_count = self.queue_length(True)
+        for i, entry in enumerate(self.queued_entries(False), emergency_count):
+            wait = self.calculate_wait_time(i, False)
+            entry["patient"].estimated_wait_time = wait
+            wait_times.append(wait)
 
-        emergency_count = len(self.emergency_queue)
-        for i, entry in enumerate(sorted(self.regular_queue, key=lambda x: x["priority_level"])):
-            patient = entry["patient"]
-            patient.estimated_wait_time = self.calculate_wait_time(emergency_count + i, False)
+        self._wait_sum = sum(wait_times)
+        self._wait_count = len(wait_times)
+        self._wait_times = SortedList(wait_times)
 
     def get_queue_statistics(self) -> dict:
+        emergency_count = self.queue_length(True)
+        regular_count = self.queue_length(False)
         return {
-            "total_patients": len(self.emergency_queue) + len(self.regular_queue),
-            "emergency_patients": len(self.emergency_queue),
-            "regular_patients": len(self.regular_queue),
+            "total_patients": emergency_count + regular_count,
+            "emergency_patients": emergency_count,
+            "regular_patients": regular_count,
             "average_wait_time": self.calculate_average_wait_time(),
             "max_wait_time": self.get_max_wait_time(),
             "active_counters": len(self.active_counters)
         }
 
     def calculate_average_wait_time(self) -> float:
-        all_wait_times = [entry["patient"].estimated_wait_time for entry in self.emergency_queue]
-        all_wait_times.extend([entry["patient"].estimated_wait_time for entry in self.regular_queue])
-        return sum(all_wait_times) / len(all_wait_times) if all_wait_times else 0
+        return self._wait_sum / self._wait_count if self._wait_count else 0
 
     def get_max_wait_time(self) -> int:
-        all_wait_times = [entry["patient"].estimated_wait_time for entry in self.emergency_queue]
-        all_wait_times.extend([entry["patient"].estimated_wait_time for entry in self.regular_queue])
-        return max(all_wait_times) if all_wait_times else 0
+        return self._wait_times[-1] if self._wait_times else 0
 
 class HospitalManagementSystem:
     def __init__(self):
         self.queue_manager = QueueManager()
         self.admitted_patients: Dict[int, Patient] = {}
         self.room_numbers = list(range(101, 201))
+        self.available_rooms = SortedList(self.room_numbers)
         self.occupied_rooms = set()
+        self._occupancy_cache = None  # report row, cleared whenever a room is assigned or released
         self.doctors = self.initialize_doctors()
-        self.patient_history = []
+        # Column-oriented patient history, one list per _PATIENT_HISTORY_COLUMNS entry
+        self.patient_history_cols: Dict[str, list] = {column: [] for column in _PATIENT_HISTORY_COLUMNS}
+        self._history_row_by_id: Dict[int, int] = {}
+        self.doctor_workload = Counter()  # history records per doctor
         self.discharge_history = []
         self.appointments = []
-        self.voice_engine = sp.init()
+        self.dept_appt_counts = Counter()
+        self.appts_by_day: Dict[date, List[dict]] = {}
+        self._voice = None  # pyttsx3 engine, created on first announcement
+        # pyttsx3 is not reentrant, so announcements run one at a time off the main thread
+        self._tts_executor = ThreadPoolExecutor(max_workers=1)
+        self._tts_lock = threading.Lock()
         self.department_stats = {}
+        self.patients_by_doctor = defaultdict(set)  # admitted patient IDs per doctor
         self.billing_records = []
+        # Running totals over billing_records for the financial summary
+        self._total_revenue = 0.0
+        self._total_insurance = 0.0
+        self._total_final = 0.0
         self.inventory = {}
         self.staff_schedule = {}
         self.maintenance_log = []
         self.emergency_stack = EmergencyStack()
-        self.patient_bst = PatientBST()
+        self._stdin_is_tty = sys.stdin.isatty()
+
+        # Menu dispatch tables, keyed by the choice typed at each prompt
+        self._main_menu_handlers = {
+            '1': self.patient_management_menu,
+            '2': self.show_queue_status,
+            '3': self.room_management_menu,
+            '4': self.appointment_management_menu,
+            '5': self.show_reports_menu,
+            '6': self.billing_menu,
+            '7': self.inventory_menu,
+            '8': self._exit_system
+        }
+        self._patient_menu_handlers = {
+            '1': lambda: self.add_patient(is_emergency=False),
+            '2': lambda: self.add_patient(is_emergency=True),
+            '3': lambda: self._with_patient("Enter patient ID: ", self.display_patient_details),
+            '4': lambda: self._with_patient("Enter patient ID: ", self.update_patient_information),
+            '5': lambda: self._with_patient("Enter patient ID to search: ", self.display_patient_details),
+            '6': self.view_all_patients,
+            '7': self.process_patient,
+            '9': lambda: _MENU_EXIT
+        }
+        self._reports_menu_handlers = {
+            '1': self.show_patient_history,
+            '2': self.show_department_report,
+            '3': self.show_occupancy_report,
+            '4': self.show_appointment_summary,
+            '5': self.show_queue_analysis,
+            '6': self.show_financial_summary,
+            '7': lambda: _MENU_EXIT
+        }
+        self._update_patient_handlers = {
+            '1': self._update_contact,
+            '2': self._add_medical_history,
+            '3': self._add_prescription,
+            '4': self._update_insurance,
+            '5': self._update_emergency_contact,
+            '6': lambda patient: None
+        }
+        # Hash lookups by ID, iterated in ID order for listings
+        self.patients_by_id: Dict[int, Patient] = SortedDict()
+
+    def _read(self, prompt: str = "") -> str:
+        # Scripted (non-tty) sessions skip input()'s readline machinery
+        if self._stdin_is_tty:
+            return input(prompt)
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+    def _read_int(self, prompt: str) -> Optional[int]:
+        # Validate up front rather than letting int() raise on bad input
+        text = self._read(prompt).strip()
+        digits = text[1:] if text[:1] in ("+", "-") else text
+        return int(text) if digits.isdecimal() else None
+
+    def _read_float(self, prompt: str) -> Optional[float]:
+        try:
+            return float(self._read(prompt))
+        except ValueError:
+            return None
+
+    def _invalid_choice(self, *args):
+        print("Invalid choice. Please try again.")
 
     def initialize_doctors(self) -> Dict[str, str]:
         return {
@@ -295,65 +555,74 @@ class HospitalManagementSystem:
 
     def add_patient(self, is_emergency: bool = False):
         try:
-            patient_id = int(input("Enter patient ID: "))
-            age = int(input("Enter age: "))
-            first_name = input("Enter first name: ").strip()
-            last_name = input("Enter last name: ").strip()
-            gender = input("Enter gender (M/F/O): ").strip().upper()
-            contact = input("Enter contact number: ").strip()
+            patient_id = self._read_int("Enter patient ID: ")
+            if patient_id is None:
+                print("Invalid input: patient ID must be a whole number")
+                return
+            age = self._read_int("Enter age: ")
+            if age is None:
+                print("Invalid input: age must be a whole number")
+                return
+            first_name = self._read("Enter first name: ").strip()
+            last_name = self._read("Enter last name: ").strip()
+            gender = self._read("Enter gender (M/F/O): ").strip().upper()
+            contact = self._read("Enter contact number: ").strip()
 
             patient = Patient(patient_id, age, first_name, last_name, gender, contact)
             patient.is_emergency = is_emergency
-            patient.admission_time = datetime.now()
 
-            blood_group = input("Enter blood group (A+/A-/B+/B-/O+/O-/AB+/AB-): ").strip().upper()
-            if blood_group not in ["A+", "A-", "B+", "B-", "O+", "O-", "AB+", "AB-"]:
+            blood_group = self._read("Enter blood group (A+/A-/B+/B-/O+/O-/AB+/AB-): ").strip().upper()
+            if blood_group not in _VALID_BLOOD_GROUPS:
                 raise ValueError("Invalid blood group")
             patient.blood_group = blood_group
 
-            ec_name = input("Enter emergency contact name: ").strip()
-            ec_relation = input("Enter relationship to patient: ").strip()
-            ec_contact = input("Enter emergency contact number: ").strip()
+            ec_name = self._read("Enter emergency contact name: ").strip()
+            ec_relation = self._read("Enter relationship to patient: ").strip()
+            ec_contact = self._read("Enter emergency contact number: ").strip()
             patient.add_emergency_contact(ec_name, ec_relation, ec_contact)
 
-            has_insurance = input("Does patient have insurance? (y/n): ").lower() == 'y'
+            has_insurance = self._read("Does patient have insurance? (y/n): ").lower() == 'y'
             if has_insurance:
-                provider = input("Enter insurance provider: ").strip()
-                policy_number = input("Enter policy number: ").strip()
-                coverage = float(input("Enter coverage amount: "))
+                provider = self._read("Enter insurance provider: ").strip()
+                policy_number = self._read("Enter policy number: ").strip()
+                coverage = float(self._read("Enter coverage amount: "))
                 patient.update_insurance(provider, policy_number, coverage)
 
             while True:
-                condition = input("Enter medical condition (or 'done' to finish): ").strip()
+                condition = self._read("Enter medical condition (or 'done' to finish): ").strip()
                 if condition.lower() == 'done':
                     break
-                date_str = input("Enter date of condition (YYYY-MM-DD): ").strip()
+                date_str = self._read("Enter date of condition (YYYY-MM-DD): ").strip()
                 condition_date = datetime.strptime(date_str, "%Y-%m-%d")
                 patient.add_medical_history(condition, condition_date)
 
-            # Add patient to BST
-            self.patient_bst.insert(patient)
+            now = datetime.now()
+            patient.admission_time = now
+
+            # Index patient for lookups and ordered listing
+            self.patients_by_id[patient.patient_id] = patient
             
             # Add emergency patients to stack
             if is_emergency:
                 self.emergency_stack.push(patient)
 
-            priority = "Critical" if is_emergency else input("Enter priority (High/Medium/Low): ").strip()
-            queue_number = self.queue_manager.add_to_queue(patient, is_emergency, priority)
+            priority = "Critical" if is_emergency else self._read("Enter priority (High/Medium/Low): ").strip()
+            queue_number = self.queue_manager.add_to_queue(patient, is_emergency, priority, now)
 
             self.show_doctors_list()
-            doctor_name = input("Enter doctor name from the list: ").strip()
-            while doctor_name not in self.doctors:
+            doctors = self.doctors
+            doctor_name = self._read("Enter doctor name from the list: ").strip()
+            while doctor_name not in doctors:
                 print("Invalid doctor name. Please choose from the list.")
-                doctor_name = input("Enter doctor name from the list: ")
+                doctor_name = self._read("Enter doctor name from the list: ")
             
             patient.doctor_name = doctor_name
-            appointment_time = datetime.now() + timedelta(minutes=patient.estimated_wait_time)
+            appointment_time = now + timedelta(minutes=patient.estimated_wait_time)
             self.schedule_appointment(patient, doctor_name, appointment_time)
 
-            self.add_to_history(patient)
+            self.add_to_history(patient, now)
 
-            announcement = f"Queue number {queue_number} for {patient.first_name} {patient.last_name}"
+            announcement = f"Queue number {queue_number} for {patient.full_name}"
             print(f"\n{announcement}")
             self.speak(announcement)
 
@@ -366,7 +635,7 @@ class HospitalManagementSystem:
             print(f"Invalid input: {str(e)}")
 
     def search_patient_record(self, patient_id: int) -> Optional[Patient]:
-        return self.patient_bst.search(patient_id)
+        return self.patients_by_id.get(patient_id)
 
     def process_patient(self):
         patient = self.queue_manager.get_next_patient()
@@ -377,11 +646,10 @@ class HospitalManagementSystem:
                 return
             patient = self.emergency_stack.pop()
 
-        print(f"Processing {'emergency' if patient.is_emergency else 'regular'} patient: {patient.first_name} {patient.last_name}")
+        print(f"Processing {'emergency' if patient.is_emergency else 'regular'} patient: {patient.full_name}")
 
         # Assign room
-        available_rooms = set(self.room_numbers) - self.occupied_rooms
-        if not available_rooms:
+        if not self.available_rooms:
             print("No rooms available!")
             # Put the patient back in appropriate queue
             if patient.is_emergency:
@@ -390,46 +658,63 @@ class HospitalManagementSystem:
                 self.queue_manager.add_to_queue(patient, patient.is_emergency)
             return
 
-        room = min(available_rooms)
+        room = self.available_rooms.pop(0)
         patient.room = room
         self.occupied_rooms.add(room)
+        self._occupancy_cache = None
         self.admitted_patients[patient.patient_id] = patient
+        if patient.doctor_name:
+            self.patients_by_doctor[patient.doctor_name].add(patient.patient_id)
 
         # Update patient status in history
-        for record in self.patient_history:
-            if record["Patient ID"] == patient.patient_id:
-                record["Status"] = "Admitted"
-                record["Room"] = room
-                break
+        row = self._history_row_by_id.get(patient.patient_id)
+        if row is not None:
+            self.patient_history_cols["Status"][row] = "Admitted"
+            self.patient_history_cols["Room"][row] = room
 
         print(f"Patient admitted to room {room}")
 
         # Update queue statistics
         self.queue_manager.update_wait_times()
 
+    def occupancy_summary(self) -> list:
+        if self._occupancy_cache is None:
+            total_rooms = len(self.room_numbers)
+            occupied = len(self.occupied_rooms)
+            occupancy_rate = (occupied / total_rooms) * 100 if total_rooms else 0.0
+            self._occupancy_cache = [
+                total_rooms,
+                occupied,
+                total_rooms - occupied,
+                f"{occupancy_rate:.1f}%"
+            ]
+        return self._occupancy_cache
+
     def show_doctors_list(self):
-        print("\nAvailable Doctors:")
-        for doctor, specialty in self.doctors.items():
-            print(f"{doctor} - {specialty}")
-
-    def add_to_history(self, patient: Patient):
-        history_record = {
-            "Patient ID": patient.patient_id,
-            "Name": f"{patient.first_name} {patient.last_name}",
-            "Age": patient.age,
-            "Gender": patient.gender,
-            "Blood Group": patient.blood_group,
-            "Doctor": patient.doctor_name,
-            "Type": "Emergency" if patient.is_emergency else "Regular",
-            "Queue Number": patient.queue_number,
-            "Timestamp": datetime.now(),
-            "Status": "Waiting",
-            "Estimated Wait Time": f"{patient.estimated_wait_time} minutes",
-            "Medical History": patient.medical_history,
-            "Insurance": patient.insurance_details,
-            "Emergency Contact": patient.emergency_contact
-        }
-        self.patient_history.append(history_record)
+        doctor_lines = "\n".join(f"{doctor} - {specialty}" for doctor, specialty in self.doctors.items())
+        print(f"\nAvailable Doctors:\n{doctor_lines}")
+
+    def add_to_history(self, patient: Patient, timestamp: datetime):
+        cols = self.patient_history_cols
+        self._history_row_by_id.setdefault(patient.patient_id, len(cols["Patient ID"]))
+
+        cols["Patient ID"].append(patient.patient_id)
+        cols["Name"].append(patient.full_name)
+        cols["Age"].append(patient.age)
+        cols["Gender"].append(patient.gender)
+        cols["Blood Group"].append(patient.blood_group)
+        cols["Doctor"].append(patient.doctor_name)
+        cols["Type"].append("Emergency" if patient.is_emergency else "Regular")
+        cols["Queue Number"].append(patient.queue_number)
+        cols["Timestamp"].append(timestamp)
+        cols["Status"].append("Waiting")
+        cols["Room"].append(None)
+        cols["Estimated Wait Time"].append(f"{patient.estimated_wait_time} minutes")
+        cols["Medical History"].append(patient.medical_history)
+        cols["Insurance"].append(patient.insurance_details)
+        cols["Emergency Contact"].append(patient.emergency_contact)
+        if patient.doctor_name:
+            self.doctor_workload[patient.doctor_name] += 1
 
     def schedule_appointment(self, patient: Patient, doctor_name: str, appointment_time: datetime):
         appointment = {
@@ -442,33 +727,55 @@ class HospitalManagementSystem:
             "follow_up": None
         }
         self.appointments.append(appointment)
+        self.dept_appt_counts[appointment["department"]] += 1
+        self.appts_by_day.setdefault(appointment_time.date(), []).append(appointment)
         print(f"Appointment scheduled with {doctor_name} at {appointment_time.strftime('%Y-%m-%d %H:%M')}")
 
+    @property
+    def voice_engine(self):
+        if self._voice is None:
+            import pyttsx3 as sp
+            self._voice = sp.init()
+        return self._voice
+
     def speak(self, text: str):
-        try:
-            self.voice_engine.say(text)
-            self.voice_engine.runAndWait()
-        except:
-            pass
+        self._tts_executor.submit(self._do_speak, text)
+
+    def _do_speak(self, text: str):
+        with self._tts_lock:
+            try:
+                self.voice_engine.say(text)
+                self.voice_engine.runAndWait()
+            except:
+                pass
 
     def show_patient_history(self):
-        if not self.patient_history:
+        cols = self.patient_history_cols
+        if not cols["Patient ID"]:
             print("No patient history available.")
             return
 
         print("\nPatient History:")
+        headers = ["ID", "Name", "Type", "Status", "Doctor", "Queue Number", "Wait Time"]
+        rows = zip(
+            cols["Patient ID"],
+            cols["Name"],
+            cols["Type"],
+            cols["Status"],
+            cols["Doctor"],
+            cols["Queue Number"],
+            cols["Estimated Wait Time"]
+        )
+
+        if len(cols["Patient ID"]) > _HISTORY_STREAM_THRESHOLD:
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(headers)
+            writer.writerows(rows)
+            return
+
         table = PrettyTable()
-        table.field_names = ["ID", "Name", "Type", "Status", "Doctor", "Queue Number", "Wait Time"]
-        for record in self.patient_history:
-            table.add_row([
-                record["Patient ID"],
-                record["Name"],
-                record["Type"],
-                record["Status"],
-                record["Doctor"],
-                record["Queue Number"],
-                record["Estimated Wait Time"]
-            ])
+        table.field_names = headers
+        table.add_rows(list(rows))
         print(table)
 
     def show_current_patients(self):
@@ -479,26 +786,24 @@ class HospitalManagementSystem:
         print("\nCurrent Admitted Patients:")
         table = PrettyTable()
         table.field_names = ["ID", "Name", "Room", "Doctor", "Admission Time"]
-        for patient in self.admitted_patients.values():
-            table.add_row([
+        table.add_rows([
+            [
                 patient.patient_id,
-                f"{patient.first_name} {patient.last_name}",
+                patient.full_name,
                 patient.room,
                 patient.doctor_name,
                 patient.admission_time.strftime("%Y-%m-%d %H:%M")
-            ])
+            ]
+            for patient in self.admitted_patients.values()
+        ])
         print(table)
 
     def show_department_stats(self):
-        department_counts = {}
-        for doctor, specialty in self.doctors.items():
-            department_counts[specialty] = sum(1 for p in self.admitted_patients.values() if p.doctor_name == doctor)
-
         print("\nDepartment Statistics:")
         table = PrettyTable()
         table.field_names = ["Department", "Current Patients"]
-        for dept, count in department_counts.items():
-            table.add_row([dept, count])
+        for doctor, dept in self.doctors.items():
+            table.add_row([dept, len(self.patients_by_doctor.get(doctor, ()))])
         print(table)
 
     def show_billing_summary(self):
@@ -509,14 +814,16 @@ class HospitalManagementSystem:
         print("\nBilling Summary:")
         table = PrettyTable()
         table.field_names = ["Patient ID", "Name", "Total Amount", "Insurance Coverage", "Final Amount"]
-        for bill in self.billing_records:
-            table.add_row([
+        table.add_rows([
+            [
                 bill["patient_id"],
                 bill["patient_name"],
                 f"${bill['total']:.2f}",
                 f"${bill['insurance_coverage']:.2f}",
                 f"${bill['final_amount']:.2f}"
-            ])
+            ]
+            for bill in self.billing_records
+        ])
         print(table)
 
     def show_inventory_status(self):
@@ -569,27 +876,25 @@ class HospitalManagementSystem:
 
     def room_management_menu(self):
         while True:
-            print("\n----- Room Management Menu -----")
-            print("1. View Available Rooms")
-            print("2. View Occupied Rooms")
-            print("3. Assign Room")
-            print("4. Release Room")
-            print("5. Back to Main Menu")
+            sys.stdout.write(_ROOM_MENU)
             
-            choice = input("\nEnter your choice (1-5): ")
+            choice = self._read("\nEnter your choice (1-5): ")
             
             if choice == '1':
-                available = set(self.room_numbers) - self.occupied_rooms
-                print(f"\nAvailable Rooms: {sorted(list(available))}")
+                print(f"\nAvailable Rooms: {list(self.available_rooms)}")
             elif choice == '2':
-                print(f"\nOccupied Rooms: {sorted(list(self.occupied_rooms))}")
+                print(f"\nOccupied Rooms: {sorted(self.occupied_rooms)}")
             elif choice == '3':
                 # Room assignment is handled in process_patient
                 print("Room assignment is handled automatically during patient processing.")
             elif choice == '4':
-                room = int(input("Enter room number to release: "))
-                if room in self.occupied_rooms:
+                room = self._read_int("Enter room number to release: ")
+                if room is None:
+                    print("Invalid room number.")
+                elif room in self.occupied_rooms:
                     self.occupied_rooms.remove(room)
+                    self.available_rooms.add(room)
+                    self._occupancy_cache = None
                     print(f"Room {room} has been released.")
                 else:
                     print("Room is not occupied.")
@@ -600,13 +905,9 @@ class HospitalManagementSystem:
 
     def appointment_management_menu(self):
         while True:
-            print("\n----- Appointment Management Menu -----")
-            print("1. View All Appointments")
-            print("2. Schedule New Appointment")
-            print("3. Cancel Appointment")
-            print("4. Back to Main Menu")
+            sys.stdout.write(_APPOINTMENT_MENU)
             
-            choice = input("\nEnter your choice (1-4): ")
+            choice = self._read("\nEnter your choice (1-4): ")
             
             if choice == '1':
                 self.show_appointments()
@@ -629,29 +930,29 @@ class HospitalManagementSystem:
         print("\nScheduled Appointments:")
         table = PrettyTable()
         table.field_names = ["Patient", "Doctor", "Time", "Status", "Department"]
-        for apt in self.appointments:
-            patient = apt["patient"]
-            table.add_row([
-                f"{patient.first_name} {patient.last_name}",
+        table.add_rows([
+            [
+                apt["patient"].full_name,
                 apt["doctor_name"],
                 apt["time"].strftime("%Y-%m-%d %H:%M"),
                 apt["status"],
                 apt["department"]
-            ])
+            ]
+            for apt in self.appointments
+        ])
         print(table)
 
     def billing_menu(self):
         while True:
-            print("\n----- Billing Menu -----")
-            print("1. Generate Bill")
-            print("2. View Billing History")
-            print("3. Update Payment Status")
-            print("4. Back to Main Menu")
+            sys.stdout.write(_BILLING_MENU)
             
-            choice = input("\nEnter your choice (1-4): ")
+            choice = self._read("\nEnter your choice (1-4): ")
             
             if choice == '1':
-                patient_id = int(input("Enter patient ID: "))
+                patient_id = self._read_int("Enter patient ID: ")
+                if patient_id is None:
+                    print("Invalid patient ID.")
+                    continue
                 patient = self.search_patient_record(patient_id)
                 if patient:
                     bill = self.generate_bill(patient)
@@ -673,21 +974,25 @@ class HospitalManagementSystem:
 
     def inventory_menu(self):
         while True:
-            print("\n----- Inventory Menu -----")
-            print("1. View Inventory")
-            print("2. Add Item")
-            print("3. Update Stock")
-            print("4. Back to Main Menu")
+            sys.stdout.write(_INVENTORY_MENU)
             
-            choice = input("\nEnter your choice (1-4): ")
+            choice = self._read("\nEnter your choice (1-4): ")
             
             if choice == '1':
                 self.show_inventory_status()
             elif choice == '2':
-                category = input("Enter category (medications/equipment/supplies): ").lower()
-                item = input("Enter item name: ")
-                quantity = int(input("Enter quantity: "))
-                price = float(input("Enter unit price: "))
+                new_category = self._read("Enter category (medications/equipment/supplies): ").lower()
+                new_item = self._read("Enter item name: ")
+                new_quantity = self._read_int("Enter quantity: ")
+                if new_quantity is None:
+                    print("Invalid quantity.")
+                    continue
+                price = self._read_float("Enter unit price: ")
+                if price is None:
+                    print("Invalid price.")
+                    continue
+                # Only remember the item for option 3 once its input is valid
+                category, item, quantity = new_category, new_item, new_quantity
                 self.add_to_inventory(category, item, quantity, price)
             elif choice == '3':
                 self.update_stock(category, item, quantity, )
@@ -740,7 +1045,7 @@ class HospitalManagementSystem:
         # Example charges (these could be more dynamic in a complete system)
         room_charge = 500 if patient.room else 0
         doctor_fee = 200
-        medication_cost = sum([100 for _ in patient.prescriptions])  # Assume $100 per prescription
+        medication_cost = 100 * len(patient.prescriptions)  # Assume $100 per prescription
 
         # Calculate total
         total = room_charge + doctor_fee + medication_cost
@@ -752,323 +1057,252 @@ class HospitalManagementSystem:
         # Store billing record
         bill_summary = {
             "patient_id": patient.patient_id,
-            "patient_name": f"{patient.first_name} {patient.last_name}",
+            "patient_name": patient.full_name,
             "total": total,
             "insurance_coverage": insurance_coverage,
             "final_amount": max(final_amount, 0)  # Avoid negative amounts
         }
         self.billing_records.append(bill_summary)
+        self._total_revenue += total
+        self._total_insurance += insurance_coverage
+        self._total_final += bill_summary["final_amount"]
 
-        print(f"Bill generated for {patient.first_name} {patient.last_name}. Total: ${total}, Final: ${final_amount}")
+        print(f"Bill generated for {patient.full_name}. Total: ${total}, Final: ${final_amount}")
         return bill_summary
        
     def patient_management_menu(self):
         while True:
-            print("\n" + "=" * 50)
-            print("           Patient Management Menu")
-            print("=" * 50)
-            print("1. Add New Patient")
-            print("2. Add Emergency Patient")
-            print("3. View Patient Details")
-            print("4. Update Patient Information")
-            print("5. Search Patient Record")
-            print("6. View All Patients")
-            print("7. Process Next Patient")
-            print("8. Process Emergency Patient")
-            print("9. Back to Main Menu")
-            print("=" * 50)
-
-            choice = input("\nEnter your choice (1-9): ")
-
-            try:
-                if choice == '1':
-                    self.add_patient(is_emergency=False)
-
-                elif choice == '2':
-                    self.add_patient(is_emergency=True)
-
-                elif choice == '3':
-                    patient_id = int(input("Enter patient ID: "))
-                    patient = self.search_patient_record(patient_id)
-                    if patient:
-                        self.display_patient_details(patient)
-                    else:
-                        print("Patient not found.")
-
-                elif choice == '4':
-                    patient_id = int(input("Enter patient ID: "))
-                    patient = self.search_patient_record(patient_id)
-                    if patient:
-                        self.update_patient_information(patient)
-                    else:
-                        print("Patient not found.")
-
-                elif choice == '5':
-                    patient_id = int(input("Enter patient ID to search: "))
-                    patient = self.search_patient_record(patient_id)
-                    if patient:
-                        self.display_patient_details(patient)
-                    else:
-                        print("Patient not found.")
-
-                elif choice == '6':
-                    self.view_all_patients()
-
-                elif choice == '7':
-                    self.process_patient()
+            sys.stdout.write(_PATIENT_MENU)
 
-                
+            choice = self._read("\nEnter your choice (1-9): ")
 
-                elif choice == '9':
+            try:
+                if self._patient_menu_handlers.get(choice, self._invalid_choice)() is _MENU_EXIT:
                     break
-                
-                else:
-                    print("Invalid choice. Please try again.")
 
             except ValueError as e:
                 print(f"Error: {str(e)}")
+
+    def _with_patient(self, prompt: str, action):
+        patient_id = self._read_int(prompt)
+        if patient_id is None:
+            print("Invalid patient ID.")
+            return
+        patient = self.search_patient_record(patient_id)
+        if patient:
+            action(patient)
+        else:
+            print("Patient not found.")
             
     def display_patient_details(self, patient: Patient):
-        print("\n" + "=" * 50)
-        print("           Patient Details")
-        print("=" * 50)
-        print(f"Patient ID: {patient.patient_id}")
-        print(f"Name: {patient.first_name} {patient.last_name}")
-        print(f"Age: {patient.age}")
-        print(f"Gender: {patient.gender}")
-        print(f"Blood Group: {patient.blood_group}")
-        print(f"Contact: {patient.contact}")
-        print(f"Room: {patient.room if patient.room else 'Not assigned'}")
-        print(f"Doctor: {patient.doctor_name if patient.doctor_name else 'Not assigned'}")
-        print(f"Emergency Status: {'Yes' if patient.is_emergency else 'No'}")
-        
-        print("\nMedical History:")
+        lines = [
+            _PATIENT_DETAILS_HEADER.rstrip("\n"),
+            f"Patient ID: {patient.patient_id}",
+            f"Name: {patient.full_name}",
+            f"Age: {patient.age}",
+            f"Gender: {patient.gender}",
+            f"Blood Group: {patient.blood_group}",
+            f"Contact: {patient.contact}",
+            f"Room: {patient.room if patient.room else 'Not assigned'}",
+            f"Doctor: {patient.doctor_name if patient.doctor_name else 'Not assigned'}",
+            f"Emergency Status: {'Yes' if patient.is_emergency else 'No'}",
+            "\nMedical History:"
+        ]
+
         if patient.medical_history:
-            for history in patient.medical_history:
-                print(f"- {history['condition']} (Date: {history['date'].strftime('%Y-%m-%d')})")
+            lines.extend(
+                f"- {history['condition']} (Date: {history['date_str']})"
+                for history in patient.medical_history
+            )
         else:
-            print("No medical history recorded")
-        
-        print("\nPrescriptions:")
+            lines.append("No medical history recorded")
+
+        lines.append("\nPrescriptions:")
         if patient.prescriptions:
             for prescription in patient.prescriptions:
-                print(f"- Medicine: {prescription['medicine']}")
-                print(f"  Dosage: {prescription['dosage']}")
-                print(f"  Duration: {prescription['duration']}")
-                print(f"  Prescribed: {prescription['date_prescribed'].strftime('%Y-%m-%d')}")
+                lines.extend((
+                    f"- Medicine: {prescription['medicine']}",
+                    f"  Dosage: {prescription['dosage']}",
+                    f"  Duration: {prescription['duration']}",
+                    f"  Prescribed: {prescription['date_prescribed_str']}"
+                ))
         else:
-            print("No prescriptions recorded")
-        
-        print("\nEmergency Contact:")
+            lines.append("No prescriptions recorded")
+
+        lines.append("\nEmergency Contact:")
         if patient.emergency_contact:
-            print(f"Name: {patient.emergency_contact['name']}")
-            print(f"Relation: {patient.emergency_contact['relation']}")
-            print(f"Contact: {patient.emergency_contact['contact']}")
-            
-        print("\nInsurance Details:")
+            lines.extend((
+                f"Name: {patient.emergency_contact['name']}",
+                f"Relation: {patient.emergency_contact['relation']}",
+                f"Contact: {patient.emergency_contact['contact']}"
+            ))
+
+        lines.append("\nInsurance Details:")
         if patient.insurance_details:
-            print(f"Provider: {patient.insurance_details['provider']}")
-            print(f"Policy Number: {patient.insurance_details['policy_number']}")
-            print(f"Coverage: ${patient.insurance_details['coverage']:.2f}")
+            lines.extend((
+                f"Provider: {patient.insurance_details['provider']}",
+                f"Policy Number: {patient.insurance_details['policy_number']}",
+                f"Coverage: ${patient.insurance_details['coverage']:.2f}"
+            ))
         else:
-            print("No insurance information recorded")
+            lines.append("No insurance information recorded")
+
+        print("\n".join(lines))
             
     def update_patient_information(self, patient: Patient):
-        print("\n" + "=" * 50)
-        print("           Update Patient Information")
-        print("=" * 50)
-        print("1. Update Contact Information")
-        print("2. Add Medical History")
-        print("3. Add Prescription")
-        print("4. Update Insurance Details")
-        print("5. Update Emergency Contact")
-        print("6. Back")
+        sys.stdout.write(_UPDATE_PATIENT_MENU)
         
-        choice = input("\nEnter your choice (1-6): ")
+        choice = self._read("\nEnter your choice (1-6): ")
         
         try:
-            if choice == '1':
-                patient.contact = input("Enter new contact number: ").strip()
-                print("Contact information updated successfully.")
-                
-            elif choice == '2':
-                condition = input("Enter medical condition: ").strip()
-                date_str = input("Enter date (YYYY-MM-DD): ").strip()
-                condition_date = datetime.strptime(date_str, "%Y-%m-%d")
-                patient.add_medical_history(condition, condition_date)
-                print("Medical history added successfully.")
-                
-            elif choice == '3':
-                medicine = input("Enter medicine name: ").strip()
-                dosage = input("Enter dosage: ").strip()
-                duration = input("Enter duration: ").strip()
-                patient.add_prescription(medicine, dosage, duration)
-                print("Prescription added successfully.")
-                
-            elif choice == '4':
-                provider = input("Enter insurance provider: ").strip()
-                policy_number = input("Enter policy number: ").strip()
-                coverage = float(input("Enter coverage amount: "))
-                patient.update_insurance(provider, policy_number, coverage)
-                print("Insurance details updated successfully.")
-                
-            elif choice == '5':
-                name = input("Enter emergency contact name: ").strip()
-                relation = input("Enter relationship to patient: ").strip()
-                contact = input("Enter emergency contact number: ").strip()
-                patient.add_emergency_contact(name, relation, contact)
-                print("Emergency contact updated successfully.")
-                
-            elif choice == '6':
-                return
-                
-            else:
-                print("Invalid choice. Please try again.")
+            self._update_patient_handlers.get(choice, self._invalid_choice)(patient)
                 
         except ValueError as e:
             print(f"Error: {str(e)}")
+
+    def _update_contact(self, patient: Patient):
+        patient.contact = self._read("Enter new contact number: ").strip()
+        print("Contact information updated successfully.")
+
+    def _add_medical_history(self, patient: Patient):
+        condition = self._read("Enter medical condition: ").strip()
+        date_str = self._read("Enter date (YYYY-MM-DD): ").strip()
+        condition_date = datetime.strptime(date_str, "%Y-%m-%d")
+        patient.add_medical_history(condition, condition_date)
+        print("Medical history added successfully.")
+
+    def _add_prescription(self, patient: Patient):
+        medicine = self._read("Enter medicine name: ").strip()
+        dosage = self._read("Enter dosage: ").strip()
+        duration = self._read("Enter duration: ").strip()
+        patient.add_prescription(medicine, dosage, duration)
+        print("Prescription added successfully.")
+
+    def _update_insurance(self, patient: Patient):
+        provider = self._read("Enter insurance provider: ").strip()
+        policy_number = self._read("Enter policy number: ").strip()
+        coverage = float(self._read("Enter coverage amount: "))
+        patient.update_insurance(provider, policy_number, coverage)
+        print("Insurance details updated successfully.")
+
+    def _update_emergency_contact(self, patient: Patient):
+        name = self._read("Enter emergency contact name: ").strip()
+        relation = self._read("Enter relationship to patient: ").strip()
+        contact = self._read("Enter emergency contact number: ").strip()
+        patient.add_emergency_contact(name, relation, contact)
+        print("Emergency contact updated successfully.")
             
-    def view_all_patients(self):
-        if not self.patient_bst.root:
+    def view_all_patients(self, page_size: int = 50):
+        if not self.patients_by_id:
             print("No patients registered in the system.")
             return
             
-        patients = self.patient_bst.inorder_traversal()
+        patients = iter(self.patients_by_id.values())
+        remaining = len(self.patients_by_id)
         
-        print("\n" + "=" * 50)
-        print("           All Patients")
-        print("=" * 50)
+        sys.stdout.write(_ALL_PATIENTS_HEADER)
         
-        table = PrettyTable()
-        table.field_names = ["ID", "Name", "Age", "Gender", "Room", "Doctor", "Status"]
-        
-        for patient in patients:
-            status = "Emergency" if patient.is_emergency else "Regular"
-            if patient.room:
-                status = "Admitted"
+        while True:
+            rows = []
+            for patient in itertools.islice(patients, page_size):
+                status = "Emergency" if patient.is_emergency else "Regular"
+                if patient.room:
+                    status = "Admitted"
+                    
+                rows.append([
+                    patient.patient_id,
+                    patient.full_name,
+                    patient.age,
+                    patient.gender,
+                    patient.room if patient.room else "Not assigned",
+                    patient.doctor_name if patient.doctor_name else "Not assigned",
+                    status
+                ])
                 
-            table.add_row([
-                patient.patient_id,
-                f"{patient.first_name} {patient.last_name}",
-                patient.age,
-                patient.gender,
-                patient.room if patient.room else "Not assigned",
-                patient.doctor_name if patient.doctor_name else "Not assigned",
-                status
-            ])
-            
-        print(table)
+            print(_render_table(["ID", "Name", "Age", "Gender", "Room", "Doctor", "Status"], rows))
+
+            remaining -= len(rows)
+            if remaining <= 0:
+                break
+            if self._read("Press Enter for next page, q to quit: ").strip().lower() == 'q':
+                break
 
     def show_reports_menu(self):
         while True:
-            print("\n----- Reports Menu -----")
-            print("1. Patient History Report")
-            print("2. Department Statistics")
-            print("3. Occupancy Report")
-            print("4. Appointment Summary")
-            print("5. Queue Analysis Report")
-            print("6. Financial Summary")
-            print("7. Back to Main Menu")
+            sys.stdout.write(_REPORTS_MENU)
 
-            choice = input("\nEnter your choice (1-7): ")
+            choice = self._read("\nEnter your choice (1-7): ")
 
-            if choice == '1':
-                self.show_patient_history()
+            if self._reports_menu_handlers.get(choice, self._invalid_choice)() is _MENU_EXIT:
+                break
 
-            elif choice == '2':
-                self.show_department_stats()
-                # Additional department analytics
-                if self.patient_history:
-                    df = pd.DataFrame(self.patient_history)
-                    print("\nDepartment Workload Analysis:")
-                    dept_counts = df.groupby("Doctor")["Patient ID"].count()
-                    print(dept_counts)
+    def show_department_report(self):
+        self.show_department_stats()
+        # Additional department analytics
+        if self.doctor_workload:
+            print("\nDepartment Workload Analysis:")
+            table = PrettyTable()
+            table.field_names = ["Doctor", "Patients"]
+            table.add_rows(sorted(self.doctor_workload.items()))
+            print(table)
 
-            elif choice == '3':
-                print("\nOccupancy Report:")
-                total_rooms = len(self.room_numbers)
-                occupied = len(self.occupied_rooms)
-                occupancy_rate = (occupied / total_rooms) * 100
+    def show_occupancy_report(self):
+        print("\nOccupancy Report:")
+        table = PrettyTable()
+        table.field_names = ["Total Rooms", "Occupied", "Available", "Occupancy Rate"]
+        table.add_row(self.occupancy_summary())
+        print(table)
 
-                table = PrettyTable()
-                table.field_names = ["Total Rooms", "Occupied", "Available", "Occupancy Rate"]
-                table.add_row([
-                    total_rooms,
-                    occupied,
-                    total_rooms - occupied,
-                    f"{occupancy_rate:.1f}%"
-                ])
-                print(table)
+    def show_appointment_summary(self):
+        if self.appointments:
+            print("\nAppointment Summary Report:")
+            table = PrettyTable()
+            table.field_names = ["Department", "Total Appointments"]
+            for dept, count in self.dept_appt_counts.items():
+                table.add_row([dept, count])
+            print(table)
 
-            elif choice == '4':
-                if self.appointments:
-                    print("\nAppointment Summary Report:")
-                    dept_appointments = {}
-                    for apt in self.appointments:
-                        dept = apt["department"]
-                        dept_appointments[dept] = dept_appointments.get(dept, 0) + 1
-
-                    table = PrettyTable()
-                    table.field_names = ["Department", "Total Appointments"]
-                    for dept, count in dept_appointments.items():
-                        table.add_row([dept, count])
-                    print(table)
-
-                    # Today's appointments
-                    today = datetime.now().date()
-                    today_appointments = [apt for apt in self.appointments 
-                                       if apt["time"].date() == today]
-                    print(f"\nToday's Appointments: {len(today_appointments)}")
-                else:
-                    print("No appointments to report.")
+            # Today's appointments
+            today = datetime.now().date()
+            print(f"\nToday's Appointments: {len(self.appts_by_day.get(today, ()))}")
+        else:
+            print("No appointments to report.")
 
-            elif choice == '5':
-                stats = self.queue_manager.get_queue_statistics()
-                print("\nQueue Analysis Report:")
-                table = PrettyTable()
-                table.field_names = ["Metric", "Value"]
-                table.add_row(["Total Patients in Queue", stats['total_patients']])
-                table.add_row(["Emergency Patients", stats['emergency_patients']])
-                table.add_row(["Regular Patients", stats['regular_patients']])
-                table.add_row(["Average Wait Time", f"{stats['average_wait_time']:.1f} minutes"])
-                table.add_row(["Maximum Wait Time", f"{stats['max_wait_time']} minutes"])
-                print(table)
-
-                # Queue history analysis
-                if self.queue_manager.queue_history:
-                    df = pd.DataFrame(self.queue_manager.queue_history)
-                    print("\nQueue History Analysis:")
-                    print(f"Total Patients Processed: {len(df)}")
-                    print(f"Emergency Cases: {len(df[df['is_emergency']])}")
-                    avg_wait = df['estimated_wait'].mean()
-                    print(f"Average Wait Time: {avg_wait:.1f} minutes")
-
-            elif choice == '6':
-                print("\nFinancial Summary Report:")
-                if self.billing_records:
-                    total_revenue = sum(bill['total'] for bill in self.billing_records)
-                    total_insurance = sum(bill['insurance_coverage'] for bill in self.billing_records)
-                    total_final = sum(bill['final_amount'] for bill in self.billing_records)
-
-                    table = PrettyTable()
-                    table.field_names = ["Metric", "Amount"]
-                    table.add_row(["Total Revenue", f"${total_revenue:.2f}"])
-                    table.add_row(["Insurance Coverage", f"${total_insurance:.2f}"])
-                    table.add_row(["Net Revenue", f"${total_final:.2f}"])
-                    table.add_row(["Average Bill Amount", f"${(total_revenue/len(self.billing_records)):.2f}"])
-                    print(table)
-                else:
-                    print("No billing records available.")
+    def show_queue_analysis(self):
+        stats = self.queue_manager.get_queue_statistics()
+        print("\nQueue Analysis Report:")
+        table = PrettyTable()
+        table.field_names = ["Metric", "Value"]
+        table.add_row(["Total Patients in Queue", stats['total_patients']])
+        table.add_row(["Emergency Patients", stats['emergency_patients']])
+        table.add_row(["Regular Patients", stats['regular_patients']])
+        table.add_row(["Average Wait Time", f"{stats['average_wait_time']:.1f} minutes"])
+        table.add_row(["Maximum Wait Time", f"{stats['max_wait_time']} minutes"])
+        print(table)
 
-            elif choice == '7':
-                break
+        # Queue history analysis
+        if self.queue_manager.queue_history:
+            df = self.queue_manager.queue_history_df()
+            print("\nQueue History Analysis:")
+            print(f"Total Patients Processed: {len(df)}")
+            print(f"Emergency Cases: {len(df[df['is_emergency']])}")
+            avg_wait = df['estimated_wait'].mean()
+            print(f"Average Wait Time: {avg_wait:.1f} minutes")
+
+    def show_financial_summary(self):
+        print("\nFinancial Summary Report:")
+        if self.billing_records:
+            print(_render_table(["Metric", "Amount"], [
+                ["Total Revenue", f"${self._total_revenue:.2f}"],
+                ["Insurance Coverage", f"${self._total_insurance:.2f}"],
+                ["Net Revenue", f"${self._total_final:.2f}"],
+                ["Average Bill Amount", f"${(self._total_revenue/len(self.billing_records)):.2f}"]
+            ]))
+        else:
+            print("No billing records available.")
 
-            else:
-                print("Invalid choice. Please try again.")
     def show_queue_status(self):
-        print("\n" + "=" * 50)
-        print("           Queue Status")
-        print("=" * 50)
+        sys.stdout.write(_QUEUE_STATUS_HEADER)
 
         stats = self.queue_manager.get_queue_statistics()
 
@@ -1084,103 +1318,59 @@ class HospitalManagementSystem:
         if self.emergency_stack.is_empty():
             print("No patients in emergency stack")
         else:
-            table = PrettyTable()
-            table.field_names = ["Position", "Patient ID", "Name", "Priority"]
-
-            for i, patient in enumerate(reversed(self.emergency_stack.items), 1):
-                table.add_row([
-                    i,
-                    patient.patient_id,
-                    f"{patient.first_name} {patient.last_name}",
-                    "Critical"
-                ])
-            print(table)
+            rows = [
+                [i, patient.patient_id, patient.full_name, "Critical"]
+                for i, patient in enumerate(self.emergency_stack.items, 1)
+            ]
+            print(_render_table(["Position", "Patient ID", "Name", "Priority"], rows))
 
         # Emergency Queue Status
         print("\nEmergency Queue Status:")
-        if not self.queue_manager.emergency_queue:
+        if not self.queue_manager.queue_length(True):
             print("No patients in emergency queue")
         else:
-            table = PrettyTable()
-            table.field_names = ["Queue Number", "Patient ID", "Name", "Priority", "Wait Time"]
-
-            sorted_emergency = sorted(
-                self.queue_manager.emergency_queue,
-                key=lambda x: (x["priority_level"], x["entry_time"])
-            )
-
-            for entry in sorted_emergency:
+            rows = []
+            for entry in self.queue_manager.queued_entries(True):
                 patient = entry["patient"]
-                table.add_row([
+                rows.append([
                     f"E{patient.queue_number}",
                     patient.patient_id,
-                    f"{patient.first_name} {patient.last_name}",
+                    patient.full_name,
                     entry["priority"],
                     f"{patient.estimated_wait_time} min"
                 ])
-            print(table)
+            print(_render_table(["Queue Number", "Patient ID", "Name", "Priority", "Wait Time"], rows))
 
         # Regular Queue Status
         print("\nRegular Queue Status:")
-        if not self.queue_manager.regular_queue:
+        if not self.queue_manager.queue_length(False):
             print("No patients in regular queue")
         else:
-            table = PrettyTable()
-            table.field_names = ["Queue Number", "Patient ID", "Name", "Priority", "Wait Time"]
-
-            sorted_regular = sorted(
-                self.queue_manager.regular_queue,
-                key=lambda x: (x["priority_level"], x["entry_time"])
-            )
-
-            for entry in sorted_regular:
+            rows = []
+            for entry in self.queue_manager.queued_entries(False):
                 patient = entry["patient"]
-                table.add_row([
+                rows.append([
                     f"R{patient.queue_number}",
                     patient.patient_id,
-                    f"{patient.first_name} {patient.last_name}",
+                    patient.full_name,
                     entry["priority"],
                     f"{patient.estimated_wait_time} min"
                 ])
-            print(table)
+            print(_render_table(["Queue Number", "Patient ID", "Name", "Priority", "Wait Time"], rows))
 
     def main_menu(self):
         while True:
-            print("\n" + "=" * 50)
-            print("           H-A-F-M Hospital Management System")
-            print("=" * 50)
-            print("1. Patient Management")
-            print("2. Queue Management")
-            print("3. Room Management")
-            print("4. Appointment Management")
-            print("5. Reports")
-            print("6. Billing")
-            print("7. Inventory")
-            print("8. Exit")
-            print("=" * 50)
+            sys.stdout.write(_MAIN_MENU)
             
-            choice = input("\nEnter your choice (1-8): ")
+            choice = self._read("\nEnter your choice (1-8): ")
             
-            if choice == '1':
-                self.patient_management_menu()
-            elif choice == '2':
-                self.show_queue_status()
-            elif choice == '3':
-                self.room_management_menu()
-            elif choice == '4':
-                self.appointment_management_menu()
-            elif choice == '5':
-                self.show_reports_menu()
-            elif choice == '6':
-                self.billing_menu()
-            elif choice == '7':
-                self.inventory_menu()
-            elif choice == '8':
-                self.speak("Thank you for using H-A-F-M Hospital Management System")
-                print("Thank you for using H-A-F-M Hospital Management System")
+            if self._main_menu_handlers.get(choice, self._invalid_choice)() is _MENU_EXIT:
                 break
-            else:
-                print("Invalid choice. Please try again.")
+
+    def _exit_system(self):
+        self.speak("Thank you for using H-A-F-M Hospital Management System")
+        print("Thank you for using H-A-F-M Hospital Management System")
+        return _MENU_EXIT
 
 def main():
     hospital = HospitalManagementSystem()